@@ -7,23 +7,92 @@ This module handles document text extraction using LlamaParse API.
 Used specifically for RAG pipeline document processing.
 """
 
+import io
 import os
-import sys
+import threading
+from concurrent.futures import Executor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Optional, Union
 import nest_asyncio
 
-try:
-    from llama_parse import LlamaParse
-except ImportError as e:
-    print(f"Missing required package: {e}")
-    print("Please install required packages:")
-    print("pip install llama-parse nest-asyncio")
-    sys.exit(1)
-
 # Apply nest_asyncio for compatibility
 nest_asyncio.apply()
 
+# Separators written around each page of extracted text
+PAGE_HEADER_OPEN = f"\n{'=' * 50}"
+PAGE_HEADER_CLOSE = f"{'=' * 50}\n"
+PAGE_FOOTER = f"\n{'-' * 30}\n"
+
+# Image extensions that are converted to grayscale before OCR
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+
+# Longest image side (pixels) sent for OCR; larger images are downscaled
+OCR_MAX_IMAGE_SIDE = 2200
+
+# JPEG quality used when re-encoding images for OCR
+OCR_JPEG_QUALITY = 95
+
+# PDFs with at least this many pages are parsed locally in parallel when a process pool is given
+PARALLEL_PDF_MIN_PAGES = 50
+
+# Pages parsed per process pool task
+PDF_PAGES_PER_TASK = 5
+
+# File extensions the extractor accepts
+SUPPORTED_EXTENSIONS = frozenset({
+    '.pdf', '.docx', '.doc', '.pptx', '.ppt',
+    '.xlsx', '.xls', '.txt', '.md', '.html', '.htm',
+    '.png', '.jpg', '.jpeg'
+})
+
+
+# Parsing backends are imported on first use so that startup only pays for
+# the ones a document actually needs.
+@lru_cache(maxsize=1)
+def _llama_parse_cls():
+    """Import LlamaParse, which pulls in the llama-index stack."""
+    try:
+        from llama_parse import LlamaParse
+    except ImportError as e:
+        print(f"Missing required package: {e}")
+        print("Please install required packages:")
+        print("pip install llama-parse nest-asyncio")
+        raise
+
+    return LlamaParse
+
+
+@lru_cache(maxsize=1)
+def _pdfium():
+    """Import pypdfium2, or return None if it is not installed."""
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    return pypdfium2
+
+
+@lru_cache(maxsize=1)
+def _pil_image():
+    """Import PIL.Image, or return None if Pillow is not installed."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+@lru_cache(maxsize=1)
+def _pil_image_ops():
+    """Import PIL.ImageOps, or return None if Pillow is not installed."""
+    try:
+        from PIL import ImageOps
+    except ImportError:
+        return None
+    return ImageOps
+
 
 class DocumentExtractor:
     """Document text extraction class using LlamaParse."""
@@ -32,14 +101,32 @@ class DocumentExtractor:
         """
         Initialize the DocumentExtractor with LlamaParse API key.
 
+        The LlamaParse client is created on first use, since local parsing
+        paths never need it.
+
         Args:
             api_key: LlamaParse API key
         """
         self.api_key = api_key
+        self._parser = None
+        self._parser_lock = threading.Lock()
+
+    @property
+    def parser(self):
+        """LlamaParse client, created on first access."""
+        with self._parser_lock:
+            if self._parser is None:
+                self._parser = self._create_parser()
+            return self._parser
+
+    def _create_parser(self):
+        """Initialize LlamaParse with premium mode, falling back to basic settings."""
+        LlamaParse = _llama_parse_cls()
+        api_key = self.api_key
 
         # Initialize parser with compatible settings
         try:
-            self.parser = LlamaParse(
+            parser = LlamaParse(
                 api_key=api_key,
                 result_type="markdown",
                 verbose=True,
@@ -52,7 +139,7 @@ class DocumentExtractor:
         except Exception as e:
             if "Incompatible parsing modes" in str(e):
                 print("⚠️  Parsing mode conflict detected. Trying with basic settings...")
-                self.parser = LlamaParse(
+                parser = LlamaParse(
                     api_key=api_key,
                     result_type="markdown",
                     verbose=True,
@@ -63,6 +150,8 @@ class DocumentExtractor:
             else:
                 raise e
 
+        return parser
+
     def get_supported_files(self, directory: str = ".") -> List[str]:
         """
         Get list of supported document files in the specified directory.
@@ -73,18 +162,12 @@ class DocumentExtractor:
         Returns:
             List of supported file paths
         """
-        supported_extensions = [
-            '.pdf', '.docx', '.doc', '.pptx', '.ppt',
-            '.xlsx', '.xls', '.txt', '.md', '.html', '.htm',
-            '.png', '.jpg', '.jpeg'
-        ]
-
         supported_files = []
         directory_path = Path(directory)
 
         if directory_path.exists() and directory_path.is_dir():
             for file_path in directory_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
+                if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
                     supported_files.append(str(file_path))
 
         return sorted(supported_files)
@@ -225,20 +308,14 @@ class DocumentExtractor:
         for doc in json_data:
             pages = doc.get("pages", [])
             for page_num, page in enumerate(pages, 1):
-                full_text.append(f"\n{'=' * 50}")
-                full_text.append(f"PAGE {page_num}")
-                full_text.append(f"{'=' * 50}\n")
-
-                # Get markdown content which preserves structure
-                markdown_content = page.get("md", "")
-                if markdown_content:
-                    full_text.append(markdown_content)
-                else:
-                    # Fallback to plain text
-                    text_content = page.get("text", "")
-                    full_text.append(text_content)
-
-                full_text.append(f"\n{'-' * 30}\n")
+                # Prefer markdown content which preserves structure, falling back to plain text
+                full_text.extend((
+                    PAGE_HEADER_OPEN,
+                    f"PAGE {page_num}",
+                    PAGE_HEADER_CLOSE,
+                    page.get("md", "") or page.get("text", ""),
+                    PAGE_FOOTER,
+                ))
 
         return "\n".join(full_text)
 
@@ -260,13 +337,133 @@ class DocumentExtractor:
         except Exception as e:
             print(f"✗ Error saving text content: {e}")
 
-    def extract_from_document(self, file_path: str = None, output_file: str = "extracted_text.txt") -> str:
+    def parse_pdf_locally(self, source: Union[str, bytes],
+                          progress_cb: Optional[Callable[[int, int], None]] = None,
+                          executor: Optional[Executor] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse a PDF with the local pdfium backend instead of LlamaParse.
+
+        Args:
+            source: Path to the PDF file, or its content as bytes
+            progress_cb: Called as progress_cb(pages_done, total_pages) after each page
+                (after each page range when parsing in parallel)
+            executor: Optional process pool; PDFs of PARALLEL_PDF_MIN_PAGES pages or more
+                are split into ranges of PDF_PAGES_PER_TASK pages parsed in parallel
+
+        Returns:
+            JSON data in the LlamaParse page layout, or None if pypdfium2 is not installed
+            or the PDF has no text layer (e.g. scanned pages that need OCR)
+        """
+        pdfium = _pdfium()
+        if pdfium is None:
+            print("⚠️  pypdfium2 not installed, falling back to LlamaParse")
+            return None
+
+        pdf = pdfium.PdfDocument(source)
+        try:
+            pages = []
+            total_pages = len(pdf)
+
+            if executor is not None and total_pages >= PARALLEL_PDF_MIN_PAGES:
+                # pdfium documents can't be shared across processes; each task reopens the file
+                pages = self._parse_pdf_in_parallel(source, total_pages, executor, progress_cb)
+            else:
+                for page_num, page in enumerate(pdf, 1):
+                    textpage = page.get_textpage()
+                    # pdfium separates lines with CRLF
+                    pages.append({"text": textpage.get_text_bounded().replace("\r\n", "\n")})
+                    textpage.close()
+                    page.close()
+                    if progress_cb:
+                        progress_cb(page_num, total_pages)
+        finally:
+            pdf.close()
+
+        if not any(page["text"].strip() for page in pages):
+            print("⚠️  PDF has no text layer, falling back to LlamaParse")
+            return None
+        return [{"pages": pages}]
+
+    def _parse_pdf_in_parallel(self, source: Union[str, bytes], total_pages: int, executor: Executor,
+                               progress_cb: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+        """Parse PDF page ranges on a process pool and return the pages in order."""
+        # Workers import only this light module, not the parsing service clients
+        from pdf_pages import extract_page_texts, shared_pdf_path
+
+        with shared_pdf_path(source) as pdf_path:
+            futures = {
+                executor.submit(
+                    extract_page_texts, pdf_path, start, min(start + PDF_PAGES_PER_TASK, total_pages)
+                ): start
+                for start in range(0, total_pages, PDF_PAGES_PER_TASK)
+            }
+
+            pages_done = 0
+            for future in as_completed(futures):
+                pages_done += len(future.result())
+                if progress_cb:
+                    progress_cb(pages_done, total_pages)
+
+            return [{"text": text} for future in futures for text in future.result()]
+
+    def prepare_image_for_ocr(self, source: Union[str, bytes]) -> Union[str, bytes]:
+        """
+        Convert an image to upright 8-bit grayscale on a white background,
+        downscaled to OCR-friendly size.
+
+        Args:
+            source: Path to the image file, or its content as bytes
+
+        Returns:
+            Re-encoded image bytes in the original format, or the source unchanged if Pillow
+            is not installed or the image can't be processed (LlamaParse then gets it as is)
+        """
+        Image = _pil_image()
+        ImageOps = _pil_image_ops()
+        if Image is None or ImageOps is None:
+            return source
+
+        try:
+            with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as img:
+                # Phone cameras write JPEGs as multi-picture MPO files; the first frame is a plain JPEG
+                image_format = "JPEG" if img.format == "MPO" else img.format
+                # Re-encoding drops the EXIF orientation tag, so rotate phone photos upright first
+                img = ImageOps.exif_transpose(img)
+                if img.mode in ("RGBA", "LA", "P"):
+                    # Put transparent areas on white; converted directly they turn black and hide dark text
+                    rgba = img.convert("RGBA")
+                    background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+                    img = Image.alpha_composite(background, rgba)
+                gray = img.convert("L")
+
+            gray.thumbnail((OCR_MAX_IMAGE_SIDE, OCR_MAX_IMAGE_SIDE), Image.LANCZOS)
+            buffer = io.BytesIO()
+            # Pillow's default JPEG quality (75) blurs small glyphs
+            save_options = {"quality": OCR_JPEG_QUALITY} if image_format == "JPEG" else {}
+            gray.save(buffer, format=image_format, **save_options)
+            return buffer.getvalue()
+        except Exception as e:
+            print(f"⚠️  Could not prepare image for OCR, sending it unchanged: {e}")
+            return source
+
+    # File extension -> local parser used instead of LlamaParse when fast parsing is enabled
+    LOCAL_PARSERS = MappingProxyType({
+        '.pdf': parse_pdf_locally,
+    })
+
+    def extract_from_document(self, file_path: str = None, output_file: Optional[str] = None,
+                              fast_pdf: bool = False,
+                              progress_cb: Optional[Callable[[int, int], None]] = None,
+                              executor: Optional[Executor] = None) -> str:
         """
         Extract text from a document file.
 
         Args:
             file_path: Path to the document to process (if None, will prompt for selection)
-            output_file: Path for the output text file
+            output_file: Path for the output text file (if None, text is only returned)
+            fast_pdf: Parse PDFs locally with pdfium, using LlamaParse only as fallback
+            progress_cb: Called as progress_cb(pages_done, total_pages) while parsing
+            executor: Optional process pool for parsing large PDFs locally in parallel
 
         Returns:
             Extracted text content
@@ -276,10 +473,56 @@ class DocumentExtractor:
             file_path = self.select_file_interactive()
 
         print(f"Processing document: {Path(file_path).name}")
+        return self._extract(file_path, Path(file_path).name, output_file, fast_pdf, progress_cb, executor)
 
+    def extract_from_bytes(self, file_bytes: bytes, file_name: str, output_file: Optional[str] = None,
+                           fast_pdf: bool = False,
+                           progress_cb: Optional[Callable[[int, int], None]] = None,
+                           executor: Optional[Executor] = None) -> str:
+        """
+        Extract text from in-memory document content without writing it to disk.
+
+        Args:
+            file_bytes: Content of the document
+            file_name: Original file name, used to detect the document type
+            output_file: Path for the output text file (if None, text is only returned)
+            fast_pdf: Parse PDFs locally with pdfium, using LlamaParse only as fallback
+            progress_cb: Called as progress_cb(pages_done, total_pages) while parsing
+            executor: Optional process pool for parsing large PDFs locally in parallel
+
+        Returns:
+            Extracted text content
+        """
+        print(f"Processing document: {file_name}")
+        return self._extract(file_bytes, file_name, output_file, fast_pdf, progress_cb, executor)
+
+    def _extract(self, source: Union[str, bytes], file_name: str, output_file: Optional[str],
+                 fast_pdf: bool, progress_cb: Optional[Callable[[int, int], None]] = None,
+                 executor: Optional[Executor] = None) -> str:
+        """Parse a document given as a path or bytes and return its formatted text."""
         try:
-            print("Parsing document with LlamaParse...")
-            json_data = self.parser.get_json_result(file_path)
+            extension = Path(file_name).suffix.lower()
+
+            # Grayscale images upload faster and OCR the same
+            if extension in IMAGE_EXTENSIONS:
+                source = self.prepare_image_for_ocr(source)
+
+            json_data = None
+            local_parser = self.LOCAL_PARSERS.get(extension) if fast_pdf else None
+            if local_parser:
+                print("Parsing document locally...")
+                json_data = local_parser(self, source, progress_cb, executor)
+
+            if json_data is None:
+                print("Parsing document with LlamaParse...")
+                # LlamaParse needs the file name to detect the type of raw bytes
+                extra_info = {"file_name": file_name} if isinstance(source, bytes) else None
+                json_data = self.parser.get_json_result(source, extra_info=extra_info)
+
+                # LlamaParse returns all pages at once, so report them in one step
+                if progress_cb:
+                    total_pages = sum(len(doc.get("pages", [])) for doc in json_data or [])
+                    progress_cb(total_pages, total_pages)
 
             if not json_data:
                 raise ValueError("No data extracted from document.")
@@ -292,10 +535,11 @@ class DocumentExtractor:
             if not text_content.strip():
                 raise ValueError("No text content found in the document")
 
-            self.save_text(text_content, output_file)
-
             print(f"🎉 Text extraction complete!")
-            print(f"📄 Text saved to: {output_file}")
+
+            if output_file:
+                self.save_text(text_content, output_file)
+                print(f"📄 Text saved to: {output_file}")
 
             # Display statistics
             lines = text_content.split('\n')
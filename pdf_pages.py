@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+PDF Page Text Module
+====================
+
+Page-range text extraction run inside the shared PDF process pool.
+Kept free of the Gemini and LlamaParse clients, so that spawned
+workers only import the PDF libraries.
+"""
+
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+import PyPDF2
+
+# pdfium extracts text several times faster than PyPDF2; PyPDF2 remains the fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+
+def preload_worker() -> None:
+    """
+    Process pool initializer. Resolving this function imports the module, so
+    the PDF libraries are loaded once per worker before any extraction task arrives.
+    """
+
+
+@contextmanager
+def shared_pdf_path(source: Union[str, bytes]) -> Iterator[str]:
+    """
+    Yield a path the pool workers can open the PDF from, so each task pickles a
+    short path instead of the whole document. Bytes are written to a temporary
+    file once and removed on exit; paths are passed through unchanged.
+    """
+    if not isinstance(source, bytes):
+        yield source
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+        pdf_file.write(source)
+    try:
+        yield pdf_file.name
+    finally:
+        os.unlink(pdf_file.name)
+
+
+def page_count(source: Union[str, bytes]) -> int:
+    """Number of pages in a PDF given as a path or bytes."""
+    if pdfium is None:
+        return len(PyPDF2.PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source).pages)
+    pdf = pdfium.PdfDocument(source)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def extract_page_texts(source: Union[str, bytes], start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end) with pdfium, one string per page."""
+    pdf = pdfium.PdfDocument(source)
+    try:
+        texts = []
+        for page_index in range(start, end):
+            page = pdf[page_index]
+            textpage = page.get_textpage()
+            # pdfium separates lines with CRLF
+            texts.append(textpage.get_text_bounded().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        pdf.close()
+
+
+def extract_page_range(source: Union[str, bytes], start: int, end: int) -> str:
+    """Extract the text of pages [start, end) as one string, each page ending in a newline."""
+    if pdfium is None:
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+        return "".join(page.extract_text() + "\n" for page in pdf_reader.pages[start:end])
+    return "".join(text + "\n" for text in extract_page_texts(source, start, end))
@@ -11,15 +11,20 @@ This module implements a complete RAG system using:
 """
 
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chunks per forward pass of the embedding model
+EMBED_BATCH_SIZE = 64
+
 try:
     from langchain.text_splitter import RecursiveCharacterTextSplitter
     from langchain_community.document_loaders import TextLoader
@@ -27,9 +32,13 @@ try:
     from langchain_huggingface import HuggingFaceEmbeddings
     from langchain_google_genai import ChatGoogleGenerativeAI
     from langchain.chains import ConversationalRetrievalChain
+    from langchain.embeddings import CacheBackedEmbeddings
+    from langchain.storage import LocalFileStore
     from langchain.memory import ConversationBufferWindowMemory
     from langchain.schema import Document
     from langchain.prompts import PromptTemplate
+    import faiss
+    import numpy as np
     import warnings
 
     warnings.filterwarnings("ignore", category=UserWarning)
@@ -58,15 +67,28 @@ class RAGPipeline:
         self.memory = None
         self.qa_chain = None
 
-    def setup_embeddings(self) -> None:
-        """Initialize HuggingFace embeddings."""
+    def setup_embeddings(self, cache_dir: Optional[str] = None) -> None:
+        """
+        Initialize HuggingFace embeddings.
+
+        Args:
+            cache_dir: Optional directory of chunk embeddings keyed by chunk text hash;
+                chunks already embedded (e.g. shared with an earlier document) are read
+                from it instead of being run through the model again
+        """
         logger.info("Setting up HuggingFace embeddings...")
         try:
+            model_name = "sentence-transformers/all-MiniLM-L6-v2"
             self.embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2",
+                model_name=model_name,
                 model_kwargs={'device': 'cpu'},
-                encode_kwargs={'normalize_embeddings': True}
+                encode_kwargs={'normalize_embeddings': True, 'batch_size': EMBED_BATCH_SIZE}
             )
+            if cache_dir:
+                self.embeddings = CacheBackedEmbeddings.from_bytes_store(
+                    self.embeddings, LocalFileStore(cache_dir), namespace=model_name,
+                    key_encoder="sha256"
+                )
             logger.info("✓ Embeddings initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize embeddings: {e}")
@@ -85,7 +107,8 @@ class RAGPipeline:
                 chunk_size=1000,
                 chunk_overlap=200,
                 length_function=len,
-                separators=["\n\n", "\n", " ", ""]
+                separators=["\n\n", "\n", " ", ""],
+                add_start_index=True
             )
 
             split_docs = text_splitter.split_documents(documents)
@@ -113,7 +136,8 @@ class RAGPipeline:
                 chunk_size=1000,
                 chunk_overlap=200,
                 length_function=len,
-                separators=["\n\n", "\n", " ", ""]
+                separators=["\n\n", "\n", " ", ""],
+                add_start_index=True
             )
 
             split_docs = text_splitter.split_documents(documents)
@@ -128,6 +152,7 @@ class RAGPipeline:
         """Create FAISS vector store from documents."""
         logger.info("Creating FAISS vector store...")
         try:
+            # One embed_documents call; the model batches its forward passes by EMBED_BATCH_SIZE
             self.vectorstore = FAISS.from_documents(
                 documents=documents,
                 embedding=self.embeddings
@@ -220,15 +245,36 @@ class RAGPipeline:
             logger.error(f"Failed to create QA chain: {e}")
             raise
 
-    def initialize_pipeline_from_text(self, text_content: str) -> None:
+    def build_vectorstore(self, text_content: str, index_path: Optional[str] = None) -> None:
+        """
+        Create the vector store from text, reusing a saved index when available.
+
+        Args:
+            text_content: Text to chunk and embed
+            index_path: Directory of a saved FAISS index; loaded if it exists,
+                otherwise written after the index is built
+        """
+        if index_path and Path(index_path).exists():
+            try:
+                self.load_vectorstore(index_path)
+                return
+            except Exception as e:
+                logger.warning(f"Saved vector store at {index_path} is unreadable, rebuilding: {e}")
+                shutil.rmtree(index_path, ignore_errors=True)
+
+        documents = self.load_and_process_text(text_content)
+        self.create_vectorstore(documents)
+        if index_path:
+            self.save_vectorstore(index_path)
+
+    def initialize_pipeline_from_text(self, text_content: str, index_path: Optional[str] = None) -> None:
         """Initialize the complete RAG pipeline from text content."""
         print("🚀 Initializing RAG Pipeline from extracted text...")
         print("=" * 50)
 
         # Setup all components
         self.setup_embeddings()
-        documents = self.load_and_process_text(text_content)
-        self.create_vectorstore(documents)
+        self.build_vectorstore(text_content, index_path)
         self.setup_llm()
         self.setup_memory()
         self.create_qa_chain()
@@ -236,6 +282,32 @@ class RAGPipeline:
         print("✅ RAG Pipeline initialized successfully!")
         print("=" * 50)
 
+    def initialize_pipeline_from_index(self, embeddings: HuggingFaceEmbeddings, vectorstore: FAISS,
+                                       llm: Optional[ChatGoogleGenerativeAI] = None) -> None:
+        """
+        Initialize the RAG pipeline around an already built embeddings model and vector store.
+
+        Args:
+            embeddings: Embeddings model the vector store was built with
+            vectorstore: FAISS vector store of the document
+            llm: Optional shared LLM client; a new one is created if not given
+        """
+        print("🚀 Initializing RAG Pipeline from existing index...")
+        print("=" * 50)
+
+        # Setup remaining components
+        self.embeddings = embeddings
+        self.vectorstore = vectorstore
+        if llm is None:
+            self.setup_llm()
+        else:
+            self.llm = llm
+        self.setup_memory()
+        self.create_qa_chain()
+
+        print("✅ RAG Pipeline initialized successfully!")
+        print("=" * 50)
+
     def initialize_pipeline_from_file(self, txt_file_path: str) -> None:
         """Initialize the complete RAG pipeline from file."""
         print("🚀 Initializing RAG Pipeline from file...")
@@ -272,6 +344,24 @@ class RAGPipeline:
             logger.error(f"Query failed: {e}")
             return {"answer": f"Sorry, I encountered an error: {e}", "source_documents": []}
 
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream the LLM response for a fully formatted prompt.
+
+        Args:
+            prompt: Prompt to send to the LLM
+
+        Yields:
+            Text chunks as they are generated
+        """
+        if not self.llm:
+            raise RuntimeError("Pipeline not initialized. Call initialize_pipeline() first.")
+
+        for chunk in self.llm.stream(prompt):
+            content = chunk.content if hasattr(chunk, 'content') else str(chunk)
+            if content:
+                yield content
+
     def clear_memory(self) -> None:
         """Clear conversation memory."""
         if self.memory:
@@ -285,13 +375,82 @@ class RAGPipeline:
         return []
 
     def save_vectorstore(self, path: str) -> None:
-        """Save the vector store to disk for future use."""
+        """
+        Save the vector store to disk for future use.
+
+        The index is written to a temporary sibling directory and renamed into
+        place, so an interrupted save never leaves a partial index at path.
+        """
         if self.vectorstore:
-            self.vectorstore.save_local(path)
-            logger.info(f"Vector store saved to: {path}")
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_dir = tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent)
+            try:
+                self.vectorstore.save_local(temp_dir)
+                os.replace(temp_dir, target)
+                logger.info(f"Vector store saved to: {path}")
+            except OSError as e:
+                # Typically another process saved the same index first
+                logger.warning(f"Vector store not saved to {path}: {e}")
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     def load_vectorstore(self, path: str) -> None:
         """Load a previously saved vector store."""
         if self.embeddings and Path(path).exists():
             self.vectorstore = FAISS.load_local(path, self.embeddings, allow_dangerous_deserialization=True)
             logger.info(f"Vector store loaded from: {path}")
+
+
+class SemanticQACache:
+    """Cache of answers keyed by question embedding, for near-duplicate questions."""
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        """
+        Initialize an empty cache. Question embeddings must be normalized, so
+        inner product equals cosine similarity.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached answer to be reused
+            max_entries: Maximum number of cached answers; the oldest half is dropped when full
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.index = None
+        self.entries = []
+
+    def lookup(self, query_embedding: List[float]) -> Optional[Tuple[str, List[Document]]]:
+        """Return the cached (answer, source documents) for the closest question above the threshold."""
+        if self.index is None or not self.entries:
+            return None
+
+        scores, ids = self.index.search(self._as_vector(query_embedding), 1)
+        if ids[0][0] < 0 or scores[0][0] < self.threshold:
+            return None
+        return self.entries[ids[0][0]][1:]
+
+    def add(self, query_embedding: List[float], answer: str, documents: List[Document]) -> None:
+        """Cache an answer and its source documents under a question embedding."""
+        if len(self.entries) >= self.max_entries:
+            self._rebuild(self.entries[self.max_entries // 2:])
+
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(len(query_embedding))
+        self.index.add(self._as_vector(query_embedding))
+        self.entries.append((query_embedding, answer, documents))
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self.index = None
+        self.entries = []
+
+    def _rebuild(self, entries: list) -> None:
+        """Re-index a subset of entries."""
+        self.clear()
+        for query_embedding, answer, documents in entries:
+            self.add(query_embedding, answer, documents)
+
+    @staticmethod
+    def _as_vector(query_embedding: List[float]) -> "np.ndarray":
+        """Shape an embedding as the (1, dim) float32 array FAISS expects."""
+        return np.asarray([query_embedding], dtype=np.float32)
@@ -9,9 +9,10 @@ Contains its own PDF loading functionality separate from document extraction.
 
 import os
 import json
-import io
-from typing import Dict
+from concurrent.futures import Executor, as_completed
+from typing import Callable, Dict, Optional
 import PyPDF2
+from pdf_pages import extract_page_range, page_count, shared_pdf_path
 
 try:
     import google.generativeai as genai
@@ -20,6 +21,9 @@ except ImportError as e:
     print("Please install: pip install google-generativeai PyPDF2")
     raise
 
+# Number of PDF pages handed to each worker when extraction is parallelized
+PAGES_PER_TASK = 10
+
 
 class BibliometricReportGenerator:
     """
@@ -58,22 +62,46 @@ class BibliometricReportGenerator:
             print(f"Error extracting text from PDF: {e}")
             return ""
 
-    def extract_text_from_pdf_bytes(self, pdf_content: bytes) -> str:
+    def extract_text_from_pdf_bytes(self, pdf_content: bytes, executor: Optional[Executor] = None,
+                                    progress_cb: Optional[Callable[[int, int], None]] = None) -> str:
         """
         Extract text content from PDF bytes
 
         Args:
             pdf_content (bytes): PDF file content as bytes
+            executor (Executor): Optional process pool; when given, page ranges of
+                PAGES_PER_TASK pages are extracted in parallel
+            progress_cb (Callable): Optional callback receiving (pages_done, total_pages)
+                as page ranges complete
 
         Returns:
             str: Extracted text content
         """
         try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            num_pages = page_count(pdf_content)
+
+            if executor is None or num_pages <= PAGES_PER_TASK:
+                text = extract_page_range(pdf_content, 0, num_pages)
+                if progress_cb:
+                    progress_cb(num_pages, num_pages)
+                return text
+
+            with shared_pdf_path(pdf_content) as pdf_path:
+                futures = {
+                    executor.submit(extract_page_range, pdf_path, start, end): end - start
+                    for start, end in (
+                        (start, min(start + PAGES_PER_TASK, num_pages))
+                        for start in range(0, num_pages, PAGES_PER_TASK)
+                    )
+                }
+
+                # Report ranges as they finish, then reassemble in page order
+                pages_done = 0
+                for future in as_completed(futures):
+                    pages_done += futures[future]
+                    if progress_cb:
+                        progress_cb(pages_done, num_pages)
+                return "".join(future.result() for future in futures)
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
@@ -121,13 +149,16 @@ class BibliometricReportGenerator:
             print(f"Error analyzing document: {e}")
             return {}
 
-    def generate_report_html(self, analysis_data: Dict, report_title: str = None) -> str:
+    def generate_report_html(self, analysis_data: Dict, report_title: str = None,
+                             use_fallback: bool = True) -> str:
         """
         Generate HTML report from analyzed data
 
         Args:
             analysis_data (Dict): Structured data from document analysis
             report_title (str): Custom title for the report
+            use_fallback (bool): Return the basic template if Gemini fails; if False,
+                the error is raised instead
 
         Returns:
             str: HTML content for the report
@@ -163,9 +194,11 @@ class BibliometricReportGenerator:
             return response.text.strip()
         except Exception as e:
             print(f"Error generating HTML: {e}")
-            return self._fallback_html(analysis_data, report_title)
+            if not use_fallback:
+                raise
+            return self.fallback_html(analysis_data, report_title)
 
-    def _fallback_html(self, data: Dict, title: str) -> str:
+    def fallback_html(self, data: Dict, title: str) -> str:
         """
         Fallback HTML template if AI generation fails
         """
@@ -322,15 +355,15 @@ class BibliometricReportGenerator:
             raise ValueError("Could not analyze document")
 
         print("Generating HTML report...")
+        stem = os.path.splitext(os.path.basename(pdf_path))[0]
         if not report_title:
-            filename = os.path.basename(pdf_path).replace('.pdf', '')
-            report_title = f"Analysis of {filename}"
+            report_title = f"Analysis of {stem}"
 
         html_content = self.generate_report_html(analysis_data, report_title)
 
         # Save report
         if not output_path:
-            output_path = f"{os.path.basename(pdf_path).replace('.pdf', '')}_report.html"
+            output_path = f"{stem}_report.html"
 
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -365,14 +398,15 @@ class BibliometricReportGenerator:
             raise ValueError("Could not analyze document")
 
         print("Generating HTML report...")
+        stem = os.path.splitext(filename)[0]
         if not report_title:
-            report_title = f"Analysis of {filename.replace('.pdf', '')}"
+            report_title = f"Analysis of {stem}"
 
         html_content = self.generate_report_html(analysis_data, report_title)
 
         # Save report
         if not output_path:
-            output_path = f"{filename.replace('.pdf', '')}_report.html"
+            output_path = f"{stem}_report.html"
 
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -12,16 +12,588 @@ All modules integrated with file upload functionality.
 """
 
 import streamlit as st
+import functools
+import gzip
+import hashlib
+import json
+import multiprocessing
 import tempfile
+import threading
 import os
 import io
+import re
 from pathlib import Path
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Iterable
+
+# Chat exchanges rendered initially, and loaded per "Load earlier messages" click.
+# A few screens cover a typical session; re-sending older turns on every chat
+# rerun would only grow the payload
+CHAT_HISTORY_WINDOW = 20
+
+# Chat exchanges kept per session; older ones are dropped from memory. Ten pages
+# of the window keeps paging back useful while bounding long-lived sessions; the
+# prompt itself only takes what fits HISTORY_TOKEN_BUDGET
+CHAT_HISTORY_LIMIT = 200
+
+# Uploads larger than this are hashed in slices to keep the working set small
+FINGERPRINT_SLICE_THRESHOLD = 64 * 1024 * 1024
+FINGERPRINT_SLICE_SIZE = 4 * 1024 * 1024
+
+# Uploads smaller than this are extracted from memory instead of a temp file
+IN_MEMORY_EXTRACTION_LIMIT = 32 * 1024 * 1024
+
+# Upper bound on documents extracted concurrently across all sessions
+MAX_EXTRACTION_WORKERS = 4
+
+# Extracted texts remembered per session, most recently used last
+SESSION_EXTRACT_CACHE_SIZE = 16
+
+# Persisted st.cache_data entries kept on disk (extracted texts, analyses, report HTML),
+# and the age after which they are deleted since they contain user documents
+PERSISTED_CACHE_MAX_FILES = 128
+PERSISTED_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# On-disk FAISS indexes, one directory per document fingerprint
+RAG_CACHE_DIR = ".rag_cache"
+
+# On-disk chunk embeddings keyed by chunk text hash, reused across documents. One
+# small file per chunk, so the directory is pruned to the most recent files
+EMBEDDING_CACHE_DIR = os.path.join(RAG_CACHE_DIR, "embeddings")
+EMBEDDING_CACHE_MAX_FILES = 50_000
+EMBEDDING_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Document indexes kept in memory across sessions
+RAG_INDEX_CACHE_SIZE = 8
+
+# Chunks retrieved per chat question
+RETRIEVAL_K = 5
+
+# Retrievals remembered per session, keyed by normalized question
+RETRIEVAL_CACHE_SIZE = 64
+
+# Follow-up questions refer back to the conversation ("why?", "tell me more", "and the
+# second one?"), so once there is history their answers aren't cached or reused. A
+# question is a follow-up if it opens with a connective or pronoun, or is short and
+# made only of filler words (no content word naming what is asked about)
+FOLLOW_UP_LEADING_WORDS = frozenset({
+    'and', 'but', 'so', 'also', 'then', 'it', "it's", 'its', 'this', 'that', 'these', 'those',
+    'they', 'them', 'their', 'he', 'she', 'his', 'her'
+})
+FOLLOW_UP_MAX_WORDS = 6
+FOLLOW_UP_FILLER_WORDS = FOLLOW_UP_LEADING_WORDS | frozenset({
+    'why', 'how', 'what', "what's", 'which', 'who', 'where', 'when', 'is', 'are', 'was', 'were',
+    'do', 'does', 'did', 'can', 'could', 'tell', 'me', 'more', 'explain', 'elaborate', 'expand',
+    'continue', 'go', 'on', 'again', 'else', 'anything', 'about', 'the', 'a', 'an', 'of', 'in',
+    'to', 'please', 'ok', 'okay', 'really', 'example', 'examples', 'detail', 'details', 'one',
+    'ones', 'first', 'second', 'third', 'last', 'other', 'another', 'previous', 'above'
+})
+
+# Answers remembered per session, keyed by (document fingerprint, normalized question)
+ANSWER_CACHE_SIZE = 128
+
+# Question embeddings remembered per session, keyed by normalized question
+QUERY_EMBED_CACHE_SIZE = 256
+
+# Characters per token assumed when the tiktoken encoding can't be loaded
+CHARS_PER_TOKEN = 4
+
+# Default token budget for retrieved context in chat prompts (adjustable in the sidebar)
+DEFAULT_CONTEXT_TOKEN_BUDGET = 2048
+
+# Token budget for previous exchanges included in chat prompts; fits a full-length
+# (1024-token) answer with its question
+HISTORY_TOKEN_BUDGET = 1536
+
+# Texts at least this long are counted with numpy instead of str.split()
+VECTORIZED_STATS_THRESHOLD = 10 * 1024 * 1024
+
+# Bytes str.split() treats as whitespace: \t \n \v \f \r, \x1c-\x1f and space
+WHITESPACE_BYTES = (9, 10, 11, 12, 13, 28, 29, 30, 31, 32)
+
+# The remaining characters str.split() treats as whitespace (NBSP, U+2000-U+200A, U+3000, ...);
+# their multi-byte UTF-8 forms are replaced with a space before the byte scan
+NON_ASCII_WHITESPACE = re.compile("[\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]")
+
+# Instructions that open every chat prompt; kept invariant between turns
+SYSTEM_PROMPT = """You are an intelligent document assistant. Your primary role is to help users understand and extract information from uploaded documents, while also being able to engage in natural conversation.
+
+Instructions for responding:
+
+1. CONVERSATIONAL INTERACTIONS (greetings, small talk, general chat):
+   - If the user is greeting you, making small talk, or having casual conversation that doesn't require document analysis, respond naturally and conversationally
+   - Be helpful and friendly without mentioning the uploaded documents
+   - Examples: "Hello", "How are you?", "Thank you", "What can you do?", etc.
+
+2. DOCUMENT-RELATED QUESTIONS (queries about content, analysis, specific information):
+   - First, carefully examine the provided context from the uploaded document
+   - If the answer is clearly found in the context, provide a comprehensive response based on that information
+   - Reference the document naturally (e.g., "According to the document...", "The text indicates...", "Based on the uploaded content...")
+
+3. OUT-OF-SCOPE QUESTIONS (information not in the document):
+   - If the question is document-related but the answer is not available in the provided context, respond with:
+   "This information is not available in the provided document. However, based on my general knowledge: [provide helpful general information]"
+   - Be clear about what comes from the document vs. your general knowledge"""
+
+# Seconds between progress bar refreshes while extraction runs in the background
+PROGRESS_POLL_INTERVAL = 0.1
+
+
+# Static feature cards and quick start guide shown on the home page
+HOME_QA_MD = """
+### 🤖 RAG Q&A System
+**Upload & Query Documents**
+- Extract text from any document
+- Ask questions about content
+- Get AI-powered answers
+- Conversational memory
+"""
+
+HOME_REPORT_MD = """
+### 📊 Bibliometric Reports
+**Generate Research Reports**
+- Upload PDF research papers
+- AI analysis of bibliometrics
+- Professional HTML reports
+- Publication insights
+"""
+
+HOME_EXTRACT_MD = """
+### 📝 Text Extraction
+**Extract Document Text**
+- Parse any document format
+- Preserve structure & headings
+- Download extracted text
+- Quick preview
+"""
+
+HOME_GUIDE_MD = """
+1. **Choose a function** from the sidebar
+2. **Upload your document** using the file uploader
+3. **Wait for processing** (may take a few moments)
+4. **Interact with results** - ask questions, download reports, or save text
+
+**Tips:**
+- Larger files take longer to process
+- PDF files work best for bibliometric analysis
+- All processing is done securely on the server
+"""
+
+# File types accepted by the RAG and text extraction uploaders
+DOCUMENT_UPLOAD_TYPES = ('pdf', 'docx', 'doc', 'pptx', 'ppt', 'xlsx', 'xls', 'txt', 'md', 'html', 'png', 'jpg', 'jpeg')
+
+# Supported format listings shown on the text extraction page
+FORMATS_DOCUMENTS_MD = """
+**Documents:**
+- PDF (.pdf)
+- Word (.docx, .doc)
+- PowerPoint (.pptx, .ppt)
+"""
+
+FORMATS_DATA_MD = """
+**Data & Other:**
+- Excel (.xlsx, .xls)
+- Text (.txt, .md)
+- HTML (.html)
+- Images (.png, .jpg, .jpeg)
+"""
+
+# Static guidance shown on the report page
+REPORT_TIPS_MD = """
+- Upload PDF files with bibliometric data
+- Research papers with citation analysis work best
+- Files with tables and statistics are ideal
+- Ensure text is readable (not scanned images)
+"""
+
+REPORT_CONTENTS_MD = """
+Your generated report will include:
+- **Executive Summary** with key statistics
+- **Publication Trends** over time
+- **Leading Organizations** and rankings
+- **Top Authors** and their contributions
+- **Collaboration Analysis** (international, regional)
+- **Key Research Areas** and keywords
+- **Recommendations** for future research
+"""
+
+
+@functools.cache
+def _get_numpy():
+    # Only needed for very large texts, so it isn't imported at startup
+    import numpy
+    return numpy
+
+
+def text_statistics(text: str) -> tuple:
+    """
+    Count words, characters and lines of a text
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        tuple: (word count, character count, line count)
+    """
+    if len(text) < VECTORIZED_STATS_THRESHOLD:
+        return len(text.split()), len(text), text.count("\n") + 1
+
+    # One vectorized scan over the UTF-8 bytes: a word starts wherever a
+    # non-whitespace byte follows whitespace (or opens the text)
+    if not text.isascii():
+        text_for_scan = NON_ASCII_WHITESPACE.sub(" ", text)
+    else:
+        text_for_scan = text
+    np = _get_numpy()
+    data = np.frombuffer(text_for_scan.encode("utf-8"), dtype=np.uint8)
+    is_space = np.isin(data, WHITESPACE_BYTES)
+    word_count = int(np.count_nonzero(is_space[:-1] & ~is_space[1:])) + int(not is_space[0])
+    line_count = int(np.count_nonzero(data == ord("\n"))) + 1
+    return word_count, len(text), line_count
+
+
+class _CharTokenEstimate:
+    """Stand-in for a tiktoken encoding that counts one token per CHARS_PER_TOKEN characters."""
+
+    def encode(self, text: str) -> list:
+        return [text[i:i + CHARS_PER_TOKEN] for i in range(0, len(text), CHARS_PER_TOKEN)]
+
+    def decode(self, tokens: list) -> str:
+        return "".join(tokens)
+
+
+@functools.cache
+def _get_token_encoding():
+    # tiktoken downloads its BPE file on first use, which fails on offline deployments
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-4")
+    except Exception as e:
+        print(f"⚠️  tiktoken unavailable, estimating tokens from characters: {e}")
+        return _CharTokenEstimate()
+
+
+def fit_token_budget(texts: Iterable[str], budget: int, truncate_overflow: bool = False) -> list:
+    """
+    Keep the leading texts whose combined token count fits within a budget
+
+    Args:
+        texts (Iterable[str]): Texts in priority order; consumed only up to the first that overflows
+        budget (int): Maximum number of tokens
+        truncate_overflow (bool): Also keep the first text that overflows, cut to the remaining tokens
+
+    Returns:
+        list: The longest prefix of texts that fits
+    """
+    encoding = _get_token_encoding()
+    kept = []
+    used = 0
+    for text in texts:
+        tokens = encoding.encode(text)
+        if used + len(tokens) > budget:
+            if truncate_overflow and used < budget:
+                kept.append(encoding.decode(tokens[:budget - used]))
+            break
+        used += len(tokens)
+        kept.append(text)
+    return kept
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for cache lookups; case and trailing punctuation don't change its meaning."""
+    return question.lower().strip().rstrip("?.!").strip()
+
+
+def is_follow_up(question: str) -> bool:
+    """
+    Whether a question likely depends on earlier turns of the conversation.
+
+    Such questions bypass both the exact-match and the semantic answer cache once
+    the chat has history (check with `python -m doctest streamlit_app.py`):
+
+    >>> [is_follow_up(q) for q in ("why?", "Tell me more", "and the second one?",
+    ...                            "What about the second one?", "It says what?")]
+    [True, True, True, True, True]
+    >>> [is_follow_up(q) for q in ("List top organizations", "Who are the top authors?",
+    ...                            "Which papers have more than 100 citations?")]
+    [False, False, False]
+    """
+    words = re.findall(r"[a-z']+", question.lower())
+    if not words or words[0] in FOLLOW_UP_LEADING_WORDS:
+        return True
+    return len(words) <= FOLLOW_UP_MAX_WORDS and FOLLOW_UP_FILLER_WORDS.issuperset(words)
+
+
+def chunk_order_key(doc) -> tuple:
+    """Sort key placing retrieved chunks in their original document order."""
+    return doc.metadata.get("start_index", -1), doc.page_content
+
+
+# Custom modules pull in heavy dependencies (LlamaParse, LangChain, torch,
+# Gemini SDK), so they are imported on first use rather than at app start.
+@functools.cache
+def _get_document_extractor_cls():
+    from document_extractor import DocumentExtractor
+    return DocumentExtractor
+
+
+@functools.cache
+def _get_rag_pipeline_cls():
+    from rag_pipeline import RAGPipeline
+    return RAGPipeline
+
+
+@functools.cache
+def _get_semantic_qa_cache_cls():
+    from rag_pipeline import SemanticQACache
+    return SemanticQACache
+
+
+@functools.cache
+def _get_report_generator_cls():
+    from report_generator import BibliometricReportGenerator
+    return BibliometricReportGenerator
+
+
+@st.cache_resource
+def get_document_extractor():
+    """DocumentExtractor shared by all sessions, created on first use."""
+    return _get_document_extractor_cls()()
+
+
+@st.cache_resource
+def get_report_generator():
+    """BibliometricReportGenerator shared by all sessions, created on first use."""
+    return _get_report_generator_cls()()
+
+
+@st.cache_resource
+def get_pdf_executor():
+    """Process pool shared across sessions for parallel PDF page extraction."""
+    from pdf_pages import preload_worker
+    # Spawned, not forked: forking the multithreaded server (with torch and FAISS
+    # loaded) can deadlock the children and duplicates its memory
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"),
+                               initializer=preload_worker)
+
+
+@st.cache_resource
+def get_extraction_dir():
+    """
+    Directory holding extracted text files, shared across sessions.
+
+    Files are deleted when an extraction is cleared or replaced; the directory
+    itself (with files of sessions that simply ended) is removed on server exit.
+    """
+    return tempfile.TemporaryDirectory(prefix="extracted_text_")
+
+
+@st.cache_resource
+def get_extraction_executor():
+    """Thread pool shared across sessions for concurrent document extraction."""
+    return ThreadPoolExecutor(max_workers=MAX_EXTRACTION_WORKERS, thread_name_prefix="extract")
 
-# Import custom modules
-from document_extractor import DocumentExtractor
-from rag_pipeline import RAGPipeline
-from report_generator import BibliometricReportGenerator
+
+def file_fingerprint(content: bytes) -> str:
+    """Return a short BLAKE2b digest of file content for use as a cache key."""
+    hasher = hashlib.blake2b(digest_size=16)
+    if len(content) > FINGERPRINT_SLICE_THRESHOLD:
+        view = memoryview(content)
+        for offset in range(0, len(view), FINGERPRINT_SLICE_SIZE):
+            hasher.update(view[offset:offset + FINGERPRINT_SLICE_SIZE])
+    else:
+        hasher.update(content)
+    return hasher.hexdigest()
+
+
+def prune_cache_files(paths, max_files: int, max_age: float) -> None:
+    """
+    Delete cache files older than max_age seconds, then the oldest beyond max_files
+
+    Args:
+        paths: Cache file paths
+        max_files (int): Number of most recently written files to keep
+        max_age (float): Age in seconds after which a file is deleted
+    """
+    entries = []
+    for path in paths:
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            # Removed concurrently
+            pass
+
+    entries.sort(reverse=True)
+    cutoff = time.time() - max_age
+    for index, (mtime, path) in enumerate(entries):
+        if index >= max_files or mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def prune_persisted_caches() -> None:
+    """Bound the persisted st.cache_data entries (.memo files), which Streamlit never evicts."""
+    from streamlit.file_util import get_streamlit_file_path
+    cache_dir = Path(get_streamlit_file_path("cache"))
+    prune_cache_files(cache_dir.glob("*.memo"), PERSISTED_CACHE_MAX_FILES, PERSISTED_CACHE_MAX_AGE)
+
+
+# Report caches are persisted like the extraction cache, so a reloaded app doesn't
+# repeat Gemini analysis of documents it has already seen; they are pruned the same
+# way, since analyses and reports hold document contents too
+@st.cache_data(show_spinner=False, max_entries=32, persist="disk")
+def analyze_pdf(pdf_hash: str, _pdf_content: bytes, _pdf_executor=None, _progress_cb=None) -> dict:
+    """
+    Extract and analyze a PDF, cached by content hash so retitled reports skip both steps.
+
+    Failures raise instead of returning, so they are not cached.
+    """
+    prune_persisted_caches()
+    report_generator = get_report_generator()
+    document_text = report_generator.extract_text_from_pdf_bytes(_pdf_content, _pdf_executor, _progress_cb)
+    if not document_text:
+        raise ValueError("Could not extract text from PDF. Please ensure the file contains readable text.")
+
+    analysis_data = report_generator.analyze_document(document_text)
+    if not analysis_data:
+        raise ValueError("Could not analyze document content.")
+    return analysis_data
+
+
+@st.cache_data(show_spinner=False, max_entries=32, persist="disk")
+def render_report_html(analysis_json: str, report_title: str) -> str:
+    """
+    Render report HTML, cached by the analysis (as sorted-key JSON) and title.
+
+    Gemini failures raise instead of returning the fallback template, so they are not cached.
+    """
+    prune_persisted_caches()
+    return get_report_generator().generate_report_html(
+        json.loads(analysis_json), report_title, use_fallback=False
+    )
+
+
+def build_report(pdf_hash: str, pdf_content: bytes, report_title: str, pdf_executor=None,
+                 progress_cb=None) -> tuple:
+    """
+    Extract, analyze and render one PDF into a gzip-compressed HTML report
+
+    Args:
+        pdf_hash (str): Content fingerprint of the PDF
+        pdf_content (bytes): PDF file content
+        report_title (str): Title of the report
+        pdf_executor: Process pool for parallel page extraction
+        progress_cb: Optional callback receiving (pages_done, total_pages)
+
+    Returns:
+        tuple: (compressed HTML bytes, uncompressed size)
+    """
+    analysis_data = analyze_pdf(pdf_hash, pdf_content, pdf_executor, progress_cb)
+    try:
+        html_content = render_report_html(json.dumps(analysis_data, sort_keys=True), report_title)
+    except Exception:
+        # Basic template for this run only; the next generation retries Gemini
+        html_content = get_report_generator().fallback_html(analysis_data, report_title)
+
+    # Stored compressed in session state; HTML shrinks several times over
+    html_bytes = html_content.encode('utf-8')
+    return gzip.compress(html_bytes, compresslevel=6), len(html_bytes)
+
+
+# Persisted to disk so parsed documents survive app restarts. The .memo files hold
+# the full text of uploaded documents, and Streamlit bounds neither their number
+# (max_entries is in-memory only) nor their age (ttl is ignored when persisting), so
+# prune_persisted_caches() deletes old ones; `streamlit cache clear` empties them all
+@st.cache_data(show_spinner=False, max_entries=64, persist="disk")
+def extract_document_text(file_hash: str, filename: str, _file_bytes: bytes, fast_pdf: bool = False,
+                          _progress_cb=None, _pdf_executor=None) -> str:
+    """
+    Extract text from uploaded file content, cached by content hash.
+
+    Only file_hash, filename and fast_pdf form the cache key; the bytes, the
+    page progress callback and the process pool for large PDFs are passed
+    through unhashed.
+    """
+    # Runs only on a cache miss, i.e. just before a new entry is persisted
+    prune_persisted_caches()
+
+    # Small files are parsed straight from memory, skipping the temp file
+    if len(_file_bytes) < IN_MEMORY_EXTRACTION_LIMIT:
+        return get_document_extractor().extract_from_bytes(
+            _file_bytes, filename, fast_pdf=fast_pdf, progress_cb=_progress_cb, executor=_pdf_executor
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, os.path.basename(filename))
+        with open(temp_path, 'wb') as tmp_file:
+            tmp_file.write(_file_bytes)
+
+        return get_document_extractor().extract_from_document(
+            temp_path, fast_pdf=fast_pdf, progress_cb=_progress_cb, executor=_pdf_executor
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def get_embeddings():
+    """HuggingFace embeddings model shared by all sessions and documents."""
+    pipeline = _get_rag_pipeline_cls()()
+    pipeline.setup_embeddings(EMBEDDING_CACHE_DIR)
+    return pipeline.embeddings
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm():
+    """Gemini chat client shared by all sessions; conversation memory stays per session."""
+    pipeline = _get_rag_pipeline_cls()()
+    pipeline.setup_llm()
+    return pipeline.llm
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up_rag_models():
+    """
+    Start loading the embedding model, Gemini client and token encoding in the
+    background, once per process, so the first document processed for Q&A doesn't
+    wait on them.
+
+    Runs on its own daemon thread rather than the extraction pool, so extraction
+    and report jobs never queue behind model loads.
+    """
+    def warm_up():
+        for loader in (get_embeddings, get_llm, _get_token_encoding):
+            try:
+                loader()
+            except Exception as e:
+                # Loaded (and reported) again on first real use
+                print(f"⚠️  Warm-up load failed: {e}")
+
+    thread = threading.Thread(target=warm_up, name="rag-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_resource(max_entries=RAG_INDEX_CACHE_SIZE, show_spinner=False)
+def get_document_index(text_hash: str, _text_content: str):
+    """
+    Embeddings model and FAISS index for a document, shared by all sessions.
+
+    Indexes are keyed by the fingerprint of the extracted text, so the same file
+    extracted with a different backend gets its own index. They are also persisted
+    under RAG_CACHE_DIR, so a restarted app reloads them instead of re-embedding.
+    Sessions build their own pipeline (LLM and memory) on top, keeping
+    conversations separate.
+    """
+    pipeline = _get_rag_pipeline_cls()()
+    pipeline.embeddings = get_embeddings()
+    pipeline.build_vectorstore(_text_content, os.path.join(RAG_CACHE_DIR, text_hash))
+
+    # Building an index is what adds chunk embeddings to the cache, so bound it here
+    prune_cache_files(
+        (path for path in Path(EMBEDDING_CACHE_DIR).rglob("*") if path.is_file()),
+        EMBEDDING_CACHE_MAX_FILES, EMBEDDING_CACHE_MAX_AGE
+    )
+    return pipeline.embeddings, pipeline.vectorstore
 
 
 class StreamlitApp:
@@ -31,6 +603,15 @@ class StreamlitApp:
         """Initialize the Streamlit app."""
         self.init_session_state()
         self.setup_page_config()
+        warm_up_rag_models()
+
+        # Sidebar page name -> render method
+        self.pages = {
+            "🏠 Home": self.render_home_page,
+            "🤖 RAG Q&A System": self.render_rag_page,
+            "📊 Bibliometric Reports": self.render_report_page,
+            "📝 Text Extraction": self.render_extraction_page,
+        }
 
     def setup_page_config(self):
         """Configure Streamlit page settings."""
@@ -43,23 +624,38 @@ class StreamlitApp:
 
     def init_session_state(self):
         """Initialize Streamlit session state variables."""
-        if 'document_extractor' not in st.session_state:
-            st.session_state.document_extractor = DocumentExtractor()
-
         if 'rag_pipeline' not in st.session_state:
             st.session_state.rag_pipeline = None
 
-        if 'report_generator' not in st.session_state:
-            st.session_state.report_generator = BibliometricReportGenerator()
-
         if 'rag_initialized' not in st.session_state:
             st.session_state.rag_initialized = False
 
         if 'chat_history' not in st.session_state:
             st.session_state.chat_history = []
 
-        if 'extracted_text' not in st.session_state:
-            st.session_state.extracted_text = None
+        if 'reports' not in st.session_state:
+            st.session_state.reports = {}
+
+        if 'chat_window' not in st.session_state:
+            st.session_state.chat_window = CHAT_HISTORY_WINDOW
+
+        if 'qa_cache' not in st.session_state:
+            st.session_state.qa_cache = None
+
+        if 'answer_cache' not in st.session_state:
+            st.session_state.answer_cache = OrderedDict()
+
+        if 'rag_doc_hash' not in st.session_state:
+            st.session_state.rag_doc_hash = None
+
+        if 'query_embed_cache' not in st.session_state:
+            st.session_state.query_embed_cache = OrderedDict()
+
+        if 'retrieval_cache' not in st.session_state:
+            st.session_state.retrieval_cache = OrderedDict()
+
+        if 'extract_cache' not in st.session_state:
+            st.session_state.extract_cache = OrderedDict()
 
     def render_sidebar(self):
         """Render the sidebar with navigation."""
@@ -69,12 +665,26 @@ class StreamlitApp:
         # Navigation menu
         page = st.sidebar.selectbox(
             "Choose Function:",
-            [
-                "🏠 Home",
-                "🤖 RAG Q&A System",
-                "📊 Bibliometric Reports",
-                "📝 Text Extraction"
-            ]
+            list(self.pages)
+        )
+
+        st.sidebar.markdown("---")
+        st.sidebar.toggle(
+            "⚡ Fast PDF backend",
+            value=False,
+            help="Parse PDFs locally with pdfium (plain text, no heading structure); scanned PDFs "
+                 "and other formats still use LlamaParse",
+            key="fast_pdf"
+        )
+
+        st.sidebar.slider(
+            "🧮 Context token budget",
+            min_value=256,
+            max_value=8192,
+            value=DEFAULT_CONTEXT_TOKEN_BUDGET,
+            step=256,
+            help="Maximum tokens of retrieved document text sent with each chat question",
+            key="context_token_budget"
         )
 
         st.sidebar.markdown("---")
@@ -90,17 +700,6 @@ class StreamlitApp:
 
         return page
 
-    def save_uploaded_file(self, uploaded_file):
-        """Save uploaded file to temporary directory and return path."""
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                return tmp_file.name
-        except Exception as e:
-            st.error(f"Error saving file: {e}")
-            return None
-
     def render_home_page(self):
         """Render the home page."""
         st.title("📄 Multi-Functional Document Processing System")
@@ -109,46 +708,19 @@ class StreamlitApp:
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            st.markdown("### 🤖 RAG Q&A System")
-            st.markdown(
-                """
-                **Upload & Query Documents**
-                - Extract text from any document
-                - Ask questions about content
-                - Get AI-powered answers
-                - Conversational memory
-                """
-            )
+            st.markdown(HOME_QA_MD)
             if st.button("Start Q&A Session", key="home_qa"):
                 st.session_state.page = "🤖 RAG Q&A System"
                 st.rerun()
 
         with col2:
-            st.markdown("### 📊 Bibliometric Reports")
-            st.markdown(
-                """
-                **Generate Research Reports**
-                - Upload PDF research papers
-                - AI analysis of bibliometrics
-                - Professional HTML reports
-                - Publication insights
-                """
-            )
+            st.markdown(HOME_REPORT_MD)
             if st.button("Generate Report", key="home_report"):
                 st.session_state.page = "📊 Bibliometric Reports"
                 st.rerun()
 
         with col3:
-            st.markdown("### 📝 Text Extraction")
-            st.markdown(
-                """
-                **Extract Document Text**
-                - Parse any document format
-                - Preserve structure & headings
-                - Download extracted text
-                - Quick preview
-                """
-            )
+            st.markdown(HOME_EXTRACT_MD)
             if st.button("Extract Text", key="home_extract"):
                 st.session_state.page = "📝 Text Extraction"
                 st.rerun()
@@ -157,19 +729,7 @@ class StreamlitApp:
         st.markdown("### 🚀 Quick Start Guide")
 
         with st.expander("How to use this system"):
-            st.markdown(
-                """
-                1. **Choose a function** from the sidebar
-                2. **Upload your document** using the file uploader
-                3. **Wait for processing** (may take a few moments)
-                4. **Interact with results** - ask questions, download reports, or save text
-
-                **Tips:**
-                - Larger files take longer to process
-                - PDF files work best for bibliometric analysis
-                - All processing is done securely on the server
-                """
-            )
+            st.markdown(HOME_GUIDE_MD)
 
     def render_rag_page(self):
         """Render the RAG Q&A page."""
@@ -184,7 +744,7 @@ class StreamlitApp:
 
             uploaded_file = st.file_uploader(
                 "Choose a document file",
-                type=['pdf', 'docx', 'doc', 'pptx', 'ppt', 'xlsx', 'xls', 'txt', 'md', 'html', 'png', 'jpg', 'jpeg'],
+                type=DOCUMENT_UPLOAD_TYPES,
                 help="Supported formats: PDF, Word, PowerPoint, Excel, Text files, Images (PNG, JPG)",
                 key="rag_uploader"
             )
@@ -204,8 +764,14 @@ class StreamlitApp:
                     if st.session_state.rag_pipeline:
                         st.session_state.rag_pipeline.clear_memory()
                     st.session_state.chat_history = []
+                    st.session_state.chat_window = CHAT_HISTORY_WINDOW
                     st.success("Memory cleared!")
                     st.rerun()
+                if st.button("🧽 Clear Semantic Cache", key="clear_qa_cache"):
+                    if st.session_state.qa_cache:
+                        st.session_state.qa_cache.clear()
+                    st.session_state.answer_cache.clear()
+                    st.success("Semantic cache cleared!")
             else:
                 st.warning("⏳ Upload and process a document first")
 
@@ -231,63 +797,134 @@ class StreamlitApp:
 
     def process_document_for_rag(self, uploaded_file):
         """Process uploaded document for RAG system."""
-        with st.spinner("🔄 Processing document for Q&A..."):
+        with st.status("🔄 Processing document for Q&A...", expanded=True) as status:
             try:
-                # Save uploaded file
-                temp_path = self.save_uploaded_file(uploaded_file)
-                if not temp_path:
-                    return
-
-                # Extract text
-                progress_bar = st.progress(0)
-                st.text("Step 1/3: Extracting text...")
-                progress_bar.progress(33)
-
-                extracted_text = st.session_state.document_extractor.extract_from_document(
-                    temp_path,
-                    "temp_extracted.txt"
+                file_bytes = uploaded_file.getvalue()
+                doc_hash = file_fingerprint(file_bytes)
+
+                # Extract text (cached by file content) in the background while
+                # the embedding model loads, since neither depends on the other
+                status.update(label="Step 1/3: Extracting text and loading embedding model...")
+
+                extraction = get_extraction_executor().submit(
+                    extract_document_text,
+                    doc_hash,
+                    uploaded_file.name,
+                    file_bytes,
+                    st.session_state.fast_pdf,
+                    None,
+                    get_pdf_executor()
                 )
+                get_embeddings()
+                extracted_text = extraction.result()
 
-                # Initialize RAG pipeline
-                st.text("Step 2/3: Initializing RAG system...")
-                progress_bar.progress(66)
+                # Initialize RAG pipeline around the (cached) document index
+                status.update(label="Step 2/3: Initializing RAG system...")
 
-                rag_pipeline = RAGPipeline()
-                rag_pipeline.initialize_pipeline_from_text(extracted_text)
+                text_hash = file_fingerprint(extracted_text.encode('utf-8'))
+                embeddings, vectorstore = get_document_index(text_hash, extracted_text)
+                rag_pipeline = _get_rag_pipeline_cls()()
+                rag_pipeline.initialize_pipeline_from_index(embeddings, vectorstore, get_llm())
 
-                st.text("Step 3/3: Finalizing setup...")
-                progress_bar.progress(100)
+                status.update(label="Step 3/3: Finalizing setup...")
 
                 # Store in session state
                 st.session_state.rag_pipeline = rag_pipeline
+                st.session_state.qa_cache = _get_semantic_qa_cache_cls()()
+                st.session_state.rag_doc_hash = text_hash
+                st.session_state.retrieval_cache = OrderedDict()
                 st.session_state.rag_initialized = True
-                st.session_state.extracted_text = extracted_text
                 st.session_state.chat_history = []
+                st.session_state.chat_window = CHAT_HISTORY_WINDOW
 
-                # Cleanup
-                os.unlink(temp_path)
-
-                st.success("🎉 Document processed successfully! You can now ask questions.")
+                status.update(label="🎉 Document processed successfully! You can now ask questions.",
+                              state="complete", expanded=False)
 
             except Exception as e:
+                status.update(label="❌ Error processing document", state="error")
                 st.error(f"❌ Error processing document: {e}")
-                if 'temp_path' in locals():
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
 
+    def render_chat_history(self, history):
+        """Render a list of (question, answer) exchanges as chat messages."""
+        for question, answer in history:
+            with st.chat_message("user"):
+                st.write(question)
+            with st.chat_message("assistant"):
+                st.write(answer)
+
+    def get_query_embedding(self, question: str) -> list:
+        """
+        Embed a question, reusing embeddings of earlier questions in this session
+
+        Args:
+            question (str): User question
+
+        Returns:
+            list: Query embedding
+        """
+        cache_key = normalize_question(question)
+        query_embed_cache = st.session_state.query_embed_cache
+        if cache_key in query_embed_cache:
+            query_embed_cache.move_to_end(cache_key)
+            return query_embed_cache[cache_key]
+
+        query_embedding = st.session_state.rag_pipeline.embeddings.embed_query(question)
+        query_embed_cache[cache_key] = query_embedding
+        while len(query_embed_cache) > QUERY_EMBED_CACHE_SIZE:
+            query_embed_cache.popitem(last=False)
+        return query_embedding
+
+    def retrieve_documents(self, question: str, query_embedding: list) -> list:
+        """
+        Retrieve the chunks relevant to a question, reusing earlier retrievals in this session
+
+        Args:
+            question (str): User question
+            query_embedding (list): Embedding of the question, searched directly so it isn't embedded twice
+
+        Returns:
+            list: Relevant documents
+        """
+        cache_key = (normalize_question(question), RETRIEVAL_K)
+        retrieval_cache = st.session_state.retrieval_cache
+        if cache_key in retrieval_cache:
+            retrieval_cache.move_to_end(cache_key)
+            return retrieval_cache[cache_key]
+
+        # Overlapping chunks can come back with identical text; keep the first of each
+        relevant_docs = []
+        seen_contents = set()
+        vectorstore = st.session_state.rag_pipeline.vectorstore
+        for doc in vectorstore.similarity_search_by_vector(query_embedding, k=RETRIEVAL_K):
+            if doc.page_content not in seen_contents:
+                seen_contents.add(doc.page_content)
+                relevant_docs.append(doc)
+        retrieval_cache[cache_key] = relevant_docs
+        while len(retrieval_cache) > RETRIEVAL_CACHE_SIZE:
+            retrieval_cache.popitem(last=False)
+        return relevant_docs
+
+    @st.fragment
     def render_chat_interface(self):
-        """Render the chat interface for RAG Q&A with improved memory handling."""
+        """
+        Render the chat interface for RAG Q&A with improved memory handling.
+
+        Runs as a fragment so submitting a question only reruns the chat block,
+        not the whole page.
+        """
         # Display chat history
         chat_container = st.container()
 
         with chat_container:
-            for i, (question, answer) in enumerate(st.session_state.chat_history):
-                with st.chat_message("user"):
-                    st.write(question)
-                with st.chat_message("assistant"):
-                    st.write(answer)
+            # Only the most recent messages are rendered; earlier ones load a page at a time
+            history = st.session_state.chat_history
+            hidden = max(len(history) - st.session_state.chat_window, 0)
+
+            if hidden and st.button(f"🕘 Load earlier messages ({hidden} hidden)", key="load_earlier"):
+                st.session_state.chat_window += CHAT_HISTORY_WINDOW
+                hidden = max(hidden - CHAT_HISTORY_WINDOW, 0)
+
+            self.render_chat_history(history[hidden:])
 
         # Chat input
         user_question = st.chat_input("Ask a question about the document...")
@@ -299,90 +936,107 @@ class StreamlitApp:
 
             # Get response from RAG system
             with st.chat_message("assistant"):
-                with st.spinner("🤔 Thinking..."):
-                    try:
-                        # IMPORTANT: Clear any stale memory state before query
-                        # This prevents the delayed response issue
-
-                        # Method 1: Use a fresh query without relying on internal memory
-                        # Get current context directly from vectorstore
-                        if hasattr(st.session_state.rag_pipeline, 'vectorstore'):
-                            # Retrieve relevant documents
-                            retriever = st.session_state.rag_pipeline.vectorstore.as_retriever(
-                                search_type="similarity",
-                                search_kwargs={"k": 5}
-                            )
-                            relevant_docs = retriever.get_relevant_documents(user_question)
-
-                            # Format context
-                            context = "\n\n".join([doc.page_content for doc in relevant_docs])
-
-                            # Format chat history for context
-                            chat_history_str = ""
-                            if st.session_state.chat_history:
-                                recent_history = st.session_state.chat_history[-3:]  # Last 3 exchanges
-                                for q, a in recent_history:
-                                    chat_history_str += f"Human: {q}\nAssistant: {a}\n\n"
-
-                            # Create prompt manually to avoid memory sync issues
-                            full_prompt = f"""You are an intelligent document assistant. Your primary role is to help users understand and extract information from uploaded documents, while also being able to engage in natural conversation.
-
-    Instructions for responding:
-
-    1. CONVERSATIONAL INTERACTIONS (greetings, small talk, general chat):
-       - If the user is greeting you, making small talk, or having casual conversation that doesn't require document analysis, respond naturally and conversationally
-       - Be helpful and friendly without mentioning the uploaded documents
-       - Examples: "Hello", "How are you?", "Thank you", "What can you do?", etc.
-
-    2. DOCUMENT-RELATED QUESTIONS (queries about content, analysis, specific information):
-       - First, carefully examine the provided context from the uploaded document
-       - If the answer is clearly found in the context, provide a comprehensive response based on that information
-       - Reference the document naturally (e.g., "According to the document...", "The text indicates...", "Based on the uploaded content...")
-
-    3. OUT-OF-SCOPE QUESTIONS (information not in the document):
-       - If the question is document-related but the answer is not available in the provided context, respond with:
-       "This information is not available in the provided document. However, based on my general knowledge: [provide helpful general information]"
-       - Be clear about what comes from the document vs. your general knowledge
-
-    Context from uploaded document:
-    {context}
-
-    Previous conversation:
-    {chat_history_str}
+                try:
+                    # IMPORTANT: Clear any stale memory state before query
+                    # This prevents the delayed response issue
+
+                    # Repeated questions about the same document reuse the earlier answer and
+                    # sources without embedding; near-duplicates are matched semantically
+                    # Follow-ups mean something different in every conversation, so they skip
+                    # both caches once there is history
+                    cacheable = not (st.session_state.chat_history and is_follow_up(user_question))
+                    qa_cache = st.session_state.qa_cache if cacheable else None
+                    answer_cache = st.session_state.answer_cache
+                    answer_key = (st.session_state.rag_doc_hash, normalize_question(user_question))
+                    cached = answer_cache.get(answer_key) if cacheable else None
+                    if cached is not None:
+                        answer_cache.move_to_end(answer_key)
+                    else:
+                        query_embedding = self.get_query_embedding(user_question)
+                        cached = qa_cache.lookup(query_embedding) if qa_cache else None
+
+                    if cached:
+                        answer, relevant_docs = cached
+                        st.write(answer)
 
-    Current question: {user_question}
+                        if st.session_state.rag_pipeline.memory:
+                            st.session_state.rag_pipeline.memory.save_context(
+                                {"question": user_question},
+                                {"answer": answer}
+                            )
 
-    Response:"""
+                    # Method 1: Use a fresh query without relying on internal memory
+                    # Get current context directly from vectorstore
+                    elif hasattr(st.session_state.rag_pipeline, 'vectorstore'):
+                        # Retrieve relevant documents
+                        with st.spinner("🤔 Thinking..."):
+                            relevant_docs = self.retrieve_documents(user_question, query_embedding)
+
+                        # Keep the most relevant chunks that fit the token budget, then format them
+                        # in document order, so the same chunks always give the same prompt
+                        context_budget = st.session_state.context_token_budget
+                        context_docs = relevant_docs[:len(fit_token_budget(
+                            [doc.page_content for doc in relevant_docs], context_budget
+                        ))]
+                        # Format chat history for context: walk back from the newest exchange
+                        # until the token budget is spent, cutting the oldest kept one short
+                        newest_first = (
+                            f"Human: {q}\nAssistant: {a}\n\n"
+                            for q, a in reversed(st.session_state.chat_history)
+                        )
+                        history_parts = fit_token_budget(
+                            newest_first, HISTORY_TOKEN_BUDGET, truncate_overflow=True
+                        )[::-1]
+
+                        # Create prompt manually to avoid memory sync issues. The invariant
+                        # instructions come first so the serving backend can reuse their prefix.
+                        # Parts are collected and joined once, without intermediate strings
+                        prompt_parts = [SYSTEM_PROMPT, "\n\nContext from uploaded document:\n"]
+                        for doc in sorted(context_docs, key=chunk_order_key):
+                            prompt_parts += (doc.page_content, "\n\n")
+                        prompt_parts.append("Previous conversation:\n")
+                        prompt_parts += history_parts
+                        prompt_parts += ("\n\nCurrent question: ", user_question, "\n\nResponse:")
+                        full_prompt = "".join(prompt_parts)
+
+                        # Stream response from LLM directly; write_stream returns the full text
+                        answer = st.write_stream(st.session_state.rag_pipeline.stream(full_prompt))
+
+                        # Update the RAG pipeline memory manually to keep it in sync
+                        if hasattr(st.session_state.rag_pipeline,
+                                   'memory') and st.session_state.rag_pipeline.memory:
+                            st.session_state.rag_pipeline.memory.save_context(
+                                {"question": user_question},
+                                {"answer": answer}
+                            )
 
-                            # Get response from LLM directly
-                            response = st.session_state.rag_pipeline.llm.invoke(full_prompt)
-                            answer = response.content if hasattr(response, 'content') else str(response)
+                        if qa_cache:
+                            qa_cache.add(query_embedding, answer, relevant_docs)
 
-                            # Update the RAG pipeline memory manually to keep it in sync
-                            if hasattr(st.session_state.rag_pipeline,
-                                       'memory') and st.session_state.rag_pipeline.memory:
-                                st.session_state.rag_pipeline.memory.save_context(
-                                    {"question": user_question},
-                                    {"answer": answer}
-                                )
+                        if cacheable:
+                            answer_cache[answer_key] = (answer, relevant_docs)
+                            while len(answer_cache) > ANSWER_CACHE_SIZE:
+                                answer_cache.popitem(last=False)
 
-                        else:
-                            # Fallback to original method
+                    else:
+                        # Fallback to original method
+                        with st.spinner("🤔 Thinking..."):
                             result = st.session_state.rag_pipeline.query(user_question)
-                            answer = result["answer"]
-
+                        answer = result["answer"]
                         st.write(answer)
 
-                        # Show source info if we have relevant docs
-                        if 'relevant_docs' in locals() and relevant_docs:
-                            st.caption(f"📚 Based on {len(relevant_docs)} relevant document sections")
+                    # Show source info if we have relevant docs
+                    if 'relevant_docs' in locals() and relevant_docs:
+                        st.caption(f"📚 Based on {len(relevant_docs)} relevant document sections")
 
-                    except Exception as e:
-                        answer = f"Sorry, I encountered an error: {e}"
-                        st.error(answer)
+                except Exception as e:
+                    answer = f"Sorry, I encountered an error: {e}"
+                    st.error(answer)
 
-            # Add to chat history AFTER getting the response
+            # Add to chat history AFTER getting the response, forgetting the oldest exchanges
+            # so a long-lived session does not hold every answer in memory
             st.session_state.chat_history.append((user_question, answer))
+            del st.session_state.chat_history[:-CHAT_HISTORY_LIMIT]
 
     def render_report_page(self):
         """Render the bibliometric report generation page."""
@@ -393,138 +1047,175 @@ class StreamlitApp:
         col1, col2 = st.columns([1, 2])
 
         with col1:
-            st.markdown("### 📤 Upload PDF Document")
+            st.markdown("### 📤 Upload PDF Documents")
 
-            uploaded_file = st.file_uploader(
-                "Choose a PDF file",
+            uploaded_files = st.file_uploader(
+                "Choose one or more PDF files",
                 type=['pdf'],
-                help="Upload a PDF containing bibliometric research data",
+                help="Upload PDFs containing bibliometric research data",
+                accept_multiple_files=True,
                 key="report_uploader"
             )
 
-            if uploaded_file is not None:
-                st.success(f"📁 PDF uploaded: {uploaded_file.name}")
-                st.info(f"📏 Size: {uploaded_file.size:,} bytes")
+            if uploaded_files:
+                st.success(f"📁 PDFs uploaded: {', '.join(f.name for f in uploaded_files)}")
+                st.info(f"📏 Size: {sum(f.size for f in uploaded_files):,} bytes")
 
                 # Custom report title
                 custom_title = st.text_input(
                     "Custom Report Title (optional)",
                     placeholder="Enter custom title or leave blank for auto-title",
+                    help="Used when a single PDF is uploaded; multiple PDFs are titled after their files",
                     key="custom_title"
                 )
 
                 if st.button("🔄 Generate Report", key="generate_report"):
-                    self.generate_bibliometric_report(uploaded_file, custom_title)
+                    self.generate_bibliometric_reports(uploaded_files, custom_title)
 
             # Report generation tips
             st.markdown("### 💡 Tips for Best Results")
-            st.markdown(
-                """
-                - Upload PDF files with bibliometric data
-                - Research papers with citation analysis work best
-                - Files with tables and statistics are ideal
-                - Ensure text is readable (not scanned images)
-                """
-            )
+            st.markdown(REPORT_TIPS_MD)
 
         with col2:
             st.markdown("### 📋 Report Preview")
+            self.render_report_results()
+
+    @st.fragment
+    def render_report_results(self):
+        """
+        Render download and preview controls for the generated reports.
 
-            # Check if we have a generated report in session state
-            if 'generated_report_html' in st.session_state and 'report_filename' in st.session_state:
-                st.success("✅ Report generated successfully!")
+        Runs as a fragment so toggling previews or downloading only reruns this block.
+        """
+        # Check if we have generated reports in session state
+        reports = st.session_state.reports
+        if reports:
+            st.success(f"✅ {len(reports)} report(s) generated successfully!")
 
-                # Download button
+            for report_filename, report in reports.items():
+                st.markdown(f"#### 📄 {report_filename}")
+                st.caption(f"📦 {report['size']:,} bytes of HTML, {len(report['gz']):,} bytes compressed")
+
+                # Download button serves the compressed report as stored
                 st.download_button(
-                    label="📥 Download HTML Report",
-                    data=st.session_state.generated_report_html,
-                    file_name=st.session_state.report_filename,
-                    mime="text/html",
-                    key="download_report"
+                    label="📥 Download HTML Report (.gz)",
+                    data=report['gz'],
+                    file_name=f"{report_filename}.gz",
+                    mime="application/gzip",
+                    key=f"download_report_{report_filename}"
                 )
 
-                # Preview in expander
-                with st.expander("👁️ Preview Report"):
+                # Preview only when requested, decompressing the stored bytes on demand
+                if st.toggle("👁️ Preview Report", key=f"preview_report_{report_filename}"):
                     st.components.v1.html(
-                        st.session_state.generated_report_html,
+                        gzip.decompress(report['gz']).decode('utf-8', errors='replace'),
                         height=600,
                         scrolling=True
                     )
 
-                # Clear report button
-                if st.button("🗑️ Clear Report", key="clear_report"):
-                    del st.session_state.generated_report_html
-                    del st.session_state.report_filename
-                    st.rerun()
+            # Clear reports button
+            if st.button("🗑️ Clear Reports", key="clear_report"):
+                st.session_state.reports = {}
+                st.rerun()
 
-            else:
-                st.info("👆 Upload a PDF and click 'Generate Report' to see results here!")
+        else:
+            st.info("👆 Upload a PDF and click 'Generate Report' to see results here!")
 
-                # Show example of what reports include
-                st.markdown("### 📊 Report Contents")
-                st.markdown(
-                    """
-                    Your generated report will include:
-                    - **Executive Summary** with key statistics
-                    - **Publication Trends** over time
-                    - **Leading Organizations** and rankings
-                    - **Top Authors** and their contributions
-                    - **Collaboration Analysis** (international, regional)
-                    - **Key Research Areas** and keywords
-                    - **Recommendations** for future research
-                    """
-                )
+            # Show example of what reports include
+            st.markdown("### 📊 Report Contents")
+            st.markdown(REPORT_CONTENTS_MD)
 
-    def generate_bibliometric_report(self, uploaded_file, custom_title):
-        """Generate bibliometric report from uploaded PDF."""
-        with st.spinner("🔄 Generating bibliometric report..."):
+    def generate_bibliometric_reports(self, uploaded_files, custom_title):
+        """Generate bibliometric reports from uploaded PDFs concurrently."""
+        with st.status("🔄 Generating bibliometric reports...", expanded=True) as status:
             try:
-                progress_bar = st.progress(0)
-
-                # Step 1: Save file
-                st.text("Step 1/4: Processing PDF...")
-                progress_bar.progress(25)
-
-                # Use BytesIO to work with file content directly
-                pdf_content = uploaded_file.getvalue()
-
-                # Step 2: Extract text
-                st.text("Step 2/4: Extracting text...")
-                progress_bar.progress(50)
-
-                document_text = st.session_state.report_generator.extract_text_from_pdf_bytes(pdf_content)
-
-                if not document_text:
-                    st.error("❌ Could not extract text from PDF. Please ensure the file contains readable text.")
+                # Skip PDFs whose current report came from the same content and title
+                jobs = []
+                report_filenames = set()
+                for number, uploaded_file in enumerate(uploaded_files, 1):
+                    base_name = os.path.splitext(uploaded_file.name)[0]
+                    if custom_title and len(uploaded_files) == 1:
+                        report_title = custom_title
+                    else:
+                        report_title = f"Analysis of {base_name}"
+
+                    pdf_content = uploaded_file.getvalue()
+                    report_filename = f"{base_name}_report.html"
+                    if report_filename in report_filenames:
+                        # Files with the same name get separate reports (and widget keys)
+                        report_filename = f"{base_name}_{number}_report.html"
+                    report_filenames.add(report_filename)
+                    report_key = (file_fingerprint(pdf_content), report_title)
+                    current = st.session_state.reports.get(report_filename)
+                    if current is None or current['key'] != report_key:
+                        jobs.append((report_filename, pdf_content, report_title, report_key))
+
+                if not jobs:
+                    status.update(label="ℹ️ Reports for these documents are already up to date.",
+                                  state="complete", expanded=False)
                     return
 
-                # Step 3: Analyze document
-                st.text("Step 3/4: Analyzing document with AI...")
-                progress_bar.progress(75)
-
-                analysis_data = st.session_state.report_generator.analyze_document(document_text)
-
-                if not analysis_data:
-                    st.error("❌ Could not analyze document content.")
+                status.update(label=f"Extracting, analyzing and rendering {len(jobs)} document(s)...")
+                progress_text = f"Generating {len(jobs)} report(s)..."
+                progress_bar = st.progress(0, text=progress_text)
+
+                # Page extraction fills the first half of each document's share of the bar;
+                # worker threads only record progress, this thread draws it
+                file_progress = [0.0] * len(jobs)
+
+                def make_progress_cb(index):
+                    def progress_cb(pages_done, total_pages):
+                        file_progress[index] = 0.5 * pages_done / total_pages if total_pages else 0.5
+                    return progress_cb
+
+                # Analysis and rendering wait on Gemini, so threads overlap them; page
+                # extraction itself still runs on the shared process pool
+                pdf_executor = get_pdf_executor()
+                executor = get_extraction_executor()
+                futures = {
+                    executor.submit(
+                        build_report, report_key[0], pdf_content, report_title, pdf_executor,
+                        make_progress_cb(index)
+                    ): index
+                    for index, (_, pdf_content, report_title, report_key) in enumerate(jobs)
+                }
+
+                failures = []
+                pending = set(futures)
+                shown_progress = None
+                while pending:
+                    finished, pending = wait(pending, timeout=PROGRESS_POLL_INTERVAL)
+                    for future in finished:
+                        index = futures[future]
+                        report_filename, _, _, report_key = jobs[index]
+                        try:
+                            report_gz, report_size = future.result()
+                            st.session_state.reports[report_filename] = {
+                                'gz': report_gz, 'size': report_size, 'key': report_key
+                            }
+                        except Exception as e:
+                            # One document failing must not discard the others' reports
+                            failures.append((report_filename, e))
+                        file_progress[index] = 1.0
+                    # Only send an update to the browser when the bar actually moves
+                    current_progress = sum(file_progress) / len(jobs)
+                    if current_progress != shown_progress:
+                        progress_bar.progress(current_progress, text=progress_text)
+                        shown_progress = current_progress
+
+                for report_filename, e in failures:
+                    st.error(f"❌ {report_filename}: {e}")
+
+                if len(failures) == len(jobs):
+                    status.update(label="❌ Error generating reports", state="error")
                     return
 
-                # Step 4: Generate HTML report
-                st.text("Step 4/4: Creating report...")
-                progress_bar.progress(90)
-
-                report_title = custom_title if custom_title else f"Analysis of {uploaded_file.name.replace('.pdf', '')}"
-                html_content = st.session_state.report_generator.generate_report_html(analysis_data, report_title)
-
-                progress_bar.progress(100)
-
-                # Store in session state
-                st.session_state.generated_report_html = html_content
-                st.session_state.report_filename = f"{uploaded_file.name.replace('.pdf', '')}_report.html"
-
-                st.success("🎉 Report generated successfully!")
+                status.update(label="🎉 Reports generated successfully!", state="complete",
+                              expanded=bool(failures))
                 st.balloons()
 
             except Exception as e:
+                status.update(label="❌ Error generating report", state="error")
                 st.error(f"❌ Error generating report: {e}")
 
     def render_extraction_page(self):
@@ -536,21 +1227,22 @@ class StreamlitApp:
         col1, col2 = st.columns([1, 2])
 
         with col1:
-            st.markdown("### 📤 Upload Document")
+            st.markdown("### 📤 Upload Documents")
 
-            uploaded_file = st.file_uploader(
-                "Choose a document file",
-                type=['pdf', 'docx', 'doc', 'pptx', 'ppt', 'xlsx', 'xls', 'txt', 'md', 'html', 'png', 'jpg', 'jpeg'],
+            uploaded_files = st.file_uploader(
+                "Choose one or more document files",
+                type=DOCUMENT_UPLOAD_TYPES,
                 help="Supported: PDF, Word, PowerPoint, Excel, Text files, Images",
+                accept_multiple_files=True,
                 key="extract_uploader"
             )
 
-            if uploaded_file is not None:
-                st.success(f"📁 File uploaded: {uploaded_file.name}")
-                st.info(f"📏 Size: {uploaded_file.size:,} bytes")
+            if uploaded_files:
+                st.success(f"📁 Files uploaded: {', '.join(f.name for f in uploaded_files)}")
+                st.info(f"📏 Size: {sum(f.size for f in uploaded_files):,} bytes")
 
                 if st.button("🔄 Extract Text", key="extract_text"):
-                    self.extract_text_from_document(uploaded_file)
+                    self.extract_text_from_document(uploaded_files)
 
             # Extraction info
             st.markdown("### ℹ️ About Text Extraction")
@@ -572,107 +1264,169 @@ class StreamlitApp:
 
         with col2:
             st.markdown("### 📄 Extracted Text")
+            self.render_extraction_results()
 
-            if 'extracted_text_content' in st.session_state and 'extraction_filename' in st.session_state:
-                st.success("✅ Text extracted successfully!")
+    @st.fragment
+    def render_extraction_results(self):
+        """
+        Render statistics, download and preview of the extracted text.
 
-                # Statistics
-                text_content = st.session_state.extracted_text_content
-                stats_col1, stats_col2, stats_col3 = st.columns(3)
-
-                with stats_col1:
-                    st.metric("Words", f"{len(text_content.split()):,}")
-                with stats_col2:
-                    st.metric("Characters", f"{len(text_content):,}")
-                with stats_col3:
-                    st.metric("Lines", f"{len(text_content.split('\n')):,}")
-
-                # Download button
-                st.download_button(
-                    label="📥 Download Text File",
-                    data=text_content,
-                    file_name=st.session_state.extraction_filename,
-                    mime="text/plain",
-                    key="download_text"
-                )
+        Runs as a fragment so toggling previews or downloading only reruns this block.
+        """
+        text_data = None
+        if 'extraction_text_path' in st.session_state and 'extraction_filename' in st.session_state:
+            try:
+                text_data = Path(st.session_state.extraction_text_path).read_bytes()
+            except FileNotFoundError:
+                # Clearing the resource cache removes the shared extraction directory
+                self.clear_extraction()
+                st.warning("⚠️ The extracted text is no longer available. Please extract the document again.")
+
+        if text_data is not None:
+            st.success("✅ Text extracted successfully!")
+
+            # Statistics (computed once at extraction time)
+            stats_col1, stats_col2, stats_col3 = st.columns(3)
+
+            with stats_col1:
+                st.metric("Words", f"{st.session_state.word_count:,}")
+            with stats_col2:
+                st.metric("Characters", f"{st.session_state.char_count:,}")
+            with stats_col3:
+                st.metric("Lines", f"{st.session_state.line_count:,}")
+
+            # The text is read back from disk for the download; st.download_button
+            # holds the whole payload in memory while the page is shown
+            st.download_button(
+                label="📥 Download Text File",
+                data=text_data,
+                file_name=st.session_state.extraction_filename,
+                mime="text/plain",
+                key="download_text"
+            )
 
-                # Preview
-                with st.expander("👁️ Preview Text (First 1000 characters)"):
-                    preview_text = text_content[:1000] + "..." if len(text_content) > 1000 else text_content
-                    st.text_area("Extracted content:", preview_text, height=300, disabled=True)
+            # Preview
+            with st.expander("👁️ Preview Text (First 1000 characters)"):
+                st.text_area("Extracted content:", st.session_state.extraction_preview,
+                             height=300, disabled=True)
 
-                # Clear extraction button
-                if st.button("🗑️ Clear Extraction", key="clear_extraction"):
-                    del st.session_state.extracted_text_content
-                    del st.session_state.extraction_filename
-                    st.rerun()
+            # Clear extraction button
+            if st.button("🗑️ Clear Extraction", key="clear_extraction"):
+                self.clear_extraction()
+                st.rerun()
 
-            else:
-                st.info("👆 Upload a document and click 'Extract Text' to see results here!")
-
-                # Show supported formats
-                st.markdown("### 📋 Supported Formats")
-                formats_col1, formats_col2 = st.columns(2)
-
-                with formats_col1:
-                    st.markdown(
-                        """
-                        **Documents:**
-                        - PDF (.pdf)
-                        - Word (.docx, .doc)
-                        - PowerPoint (.pptx, .ppt)
-                        """
-                    )
+        else:
+            st.info("👆 Upload a document and click 'Extract Text' to see results here!")
 
-                with formats_col2:
-                    st.markdown(
-                        """
-                        **Data & Other:**
-                        - Excel (.xlsx, .xls)
-                        - Text (.txt, .md)
-                        - HTML (.html)
-                        - Images (.png, .jpg, .jpeg)
-                        """
-                    )
+            # Show supported formats
+            st.markdown("### 📋 Supported Formats")
+            formats_col1, formats_col2 = st.columns(2)
 
-    def extract_text_from_document(self, uploaded_file):
-        """Extract text from uploaded document."""
-        with st.spinner("🔄 Extracting text from document..."):
-            try:
-                # Save uploaded file
-                temp_path = self.save_uploaded_file(uploaded_file)
-                if not temp_path:
-                    return
+            with formats_col1:
+                st.markdown(FORMATS_DOCUMENTS_MD)
 
-                progress_bar = st.progress(0)
-                st.text("Processing document with advanced parser...")
-                progress_bar.progress(50)
+            with formats_col2:
+                st.markdown(FORMATS_DATA_MD)
 
-                # Extract text using document extractor
-                extracted_text = st.session_state.document_extractor.extract_from_document(
-                    temp_path,
-                    "temp_extraction.txt"
-                )
+    def clear_extraction(self):
+        """Remove the current extraction result and its temporary file."""
+        text_path = st.session_state.pop('extraction_text_path', None)
+        if text_path:
+            Path(text_path).unlink(missing_ok=True)
+        st.session_state.pop('extraction_filename', None)
+        st.session_state.pop('extraction_preview', None)
 
-                progress_bar.progress(100)
+    def extract_text_from_document(self, uploaded_files):
+        """Extract text from one or more uploaded documents in parallel."""
+        with st.status("🔄 Extracting text from documents...", expanded=True) as status:
+            try:
+                jobs = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+                fast_pdf = st.session_state.fast_pdf
+                extract_cache = st.session_state.extract_cache
+                cache_keys = [(file_fingerprint(file_bytes), fast_pdf) for _, file_bytes in jobs]
+
+                # Worker threads report per-page progress here; only this thread touches the UI
+                file_progress = [0.0] * len(jobs)
+
+                def make_progress_cb(index):
+                    def progress_cb(pages_done, total_pages):
+                        file_progress[index] = pages_done / total_pages if total_pages else 1.0
+                    return progress_cb
+
+                # Documents already extracted in this session skip the shared cache entirely
+                results = [None] * len(jobs)
+                for index, cache_key in enumerate(cache_keys):
+                    if cache_key in extract_cache:
+                        extract_cache.move_to_end(cache_key)
+                        results[index] = extract_cache[cache_key]
+                        file_progress[index] = 1.0
+                misses = [index for index, text in enumerate(results) if text is None]
+
+                # Parsing happens in the LlamaParse API, so threads are enough to overlap uploads;
+                # large PDFs parsed locally fan their pages out to the process pool
+                if misses:
+                    progress_text = f"Processing {len(jobs)} document(s) with advanced parser..."
+                    progress_bar = st.progress(0, text=progress_text)
+
+                    executor = get_extraction_executor()
+                    pdf_executor = get_pdf_executor()
+                    futures = {
+                        executor.submit(
+                            extract_document_text, cache_keys[index][0], jobs[index][0], jobs[index][1],
+                            fast_pdf, make_progress_cb(index), pdf_executor
+                        ): index
+                        for index in misses
+                    }
+                    pending = set(futures)
+                    shown_progress = None
+                    while pending:
+                        finished, pending = wait(pending, timeout=PROGRESS_POLL_INTERVAL)
+                        for future in finished:
+                            results[futures[future]] = future.result()
+                            file_progress[futures[future]] = 1.0
+                        # Only send an update to the browser when the bar actually moves
+                        current_progress = sum(file_progress) / len(jobs)
+                        if current_progress != shown_progress:
+                            progress_bar.progress(current_progress, text=progress_text)
+                            shown_progress = current_progress
+
+                    for index in misses:
+                        extract_cache[cache_keys[index]] = results[index]
+                    while len(extract_cache) > SESSION_EXTRACT_CACHE_SIZE:
+                        extract_cache.popitem(last=False)
 
                 # Store in session state
-                base_name = uploaded_file.name.split('.')[0]
-                st.session_state.extracted_text_content = extracted_text
-                st.session_state.extraction_filename = f"{base_name}_extracted.txt"
-
-                # Cleanup
-                os.unlink(temp_path)
+                if len(jobs) == 1:
+                    base_name = Path(jobs[0][0]).stem
+                    extracted_text = results[0]
+                    extraction_filename = f"{base_name}_extracted.txt"
+                else:
+                    extracted_text = "\n".join(
+                        f"\n{'#' * 50}\nFILE: {name}\n{'#' * 50}\n{text}"
+                        for (name, _), text in zip(jobs, results)
+                    )
+                    extraction_filename = "documents_extracted.txt"
+
+                # Keep only a handle to the text in session state; the page reads it back lazily
+                self.clear_extraction()
+                with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False,
+                                                 dir=get_extraction_dir().name) as text_file:
+                    text_file.write(extracted_text)
+
+                st.session_state.extraction_text_path = text_file.name
+                st.session_state.extraction_filename = extraction_filename
+                st.session_state.extraction_preview = (
+                    extracted_text[:1000] + "..." if len(extracted_text) > 1000 else extracted_text
+                )
+                (st.session_state.word_count,
+                 st.session_state.char_count,
+                 st.session_state.line_count) = text_statistics(extracted_text)
 
-                st.success("🎉 Text extraction completed!")
+                status.update(label="🎉 Text extraction completed!", state="complete", expanded=False)
 
             except Exception as e:
+                status.update(label="❌ Error extracting text", state="error")
                 st.error(f"❌ Error extracting text: {e}")
-                if 'temp_path' in locals():
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
 
     def run(self):
         """Run the Streamlit application."""
@@ -680,14 +1434,7 @@ class StreamlitApp:
         page = self.render_sidebar()
 
         # Route to appropriate page
-        if page == "🏠 Home":
-            self.render_home_page()
-        elif page == "🤖 RAG Q&A System":
-            self.render_rag_page()
-        elif page == "📊 Bibliometric Reports":
-            self.render_report_page()
-        elif page == "📝 Text Extraction":
-            self.render_extraction_page()
+        self.pages.get(page, self.render_home_page)()
 
 
 def main():